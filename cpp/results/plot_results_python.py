@@ -13,22 +13,21 @@ view_states = False
 view_animation = True
 
 # Read the data file - handle ragged arrays (different column counts per row)
-with open('trajectories.txt', 'r') as f:
-    lines = f.readlines()
-
-# Parse the file manually since rows have different column counts
+# Rows are parsed as the file is streamed rather than after readlines()
 data_rows = []
 max_cols = 0
 
-for line in lines:
-    values = [float(x) for x in line.strip().split()]
-    data_rows.append(values)
-    max_cols = max(max_cols, len(values))
+with open('trajectories.txt', 'r') as f:
+    for line in f:
+        # np.fromstring tokenizes in C instead of calling float() per token
+        values = np.fromstring(line, sep=' ')
+        data_rows.append(values)
+        max_cols = max(max_cols, values.size)
 
 # Create padded matrix (pad with zeros where needed)
 M = np.zeros((len(data_rows), max_cols))
 for i, row in enumerate(data_rows):
-    M[i, :len(row)] = row
+    M[i, :row.size] = row
 
 # Extract parameters from first line
 N = int(M[0, 0])  # Number of agents
@@ -53,14 +52,9 @@ all_pos = M[start:final, :]
 num_timesteps = len(data_rows[start])
 
 # Organize trajectories by agent
+# Rows are stacked as x, y, z per agent, so (3*N_cmd, T) -> (N_cmd, 3, T)
 # pk will have shape (N_cmd, time_steps, 3)
-pk = np.zeros((N_cmd, num_timesteps, 3))
-
-for i in range(N_cmd):
-    # Extract x, y, z for agent i
-    pk[i, :, 0] = M[start + 3*i, :num_timesteps]      # x coordinate
-    pk[i, :, 1] = M[start + 3*i + 1, :num_timesteps]  # y coordinate
-    pk[i, :, 2] = M[start + 3*i + 2, :num_timesteps]  # z coordinate
+pk = all_pos[:, :num_timesteps].reshape(N_cmd, 3, num_timesteps).transpose(0, 2, 1).copy()
 
 # Time array (assuming 0.01s time step)
 T = 0.01 * (pk.shape[1] - 1)
@@ -72,11 +66,10 @@ if len(t) > pk.shape[1]:
 if view_states:
     # Figure 1: Distance to target over time
     fig1 = plt.figure(1, figsize=(10, 6))
+    # Distance to target for all agents at once, shape (N_cmd, time_steps)
+    dists = np.linalg.norm(pk - pf[0, :, np.newaxis, :], axis=2)
     for i in range(N_cmd):
-        # Calculate distance to target
-        diff = pk[i, :, :] - pf[0, i, :]
-        dist = np.sqrt(np.sum(diff**2, axis=1))
-        plt.plot(t[:len(dist)], dist, linewidth=1.5, label=f'Agent {i+1}')
+        plt.plot(t[:dists.shape[1]], dists[i], linewidth=1.5, label=f'Agent {i+1}')
     plt.grid(True)
     plt.xlabel('t [s]')
     plt.ylabel('Distance to target [m]')
@@ -114,8 +107,21 @@ if view_animation:
     # Generate distinct colors for each agent
     colors = plt.cm.tab10(np.linspace(0, 1, N))
 
+    # Initial and target positions do not move, so plot them once
+    for i in range(N):
+        ax.plot([po[0, i, 0]], [po[0, i, 1]], [po[0, i, 2]],
+               '^', markersize=10, color=colors[i])
+        if i < N_cmd:
+            ax.plot([pf[0, i, 0]], [pf[0, i, 1]], [pf[0, i, 2]],
+                   'x', markersize=10, color=colors[i], linewidth=3)
+
+    # One marker per commanded agent, moved with set_data_3d each frame
+    pos_artists = [ax.plot([], [], [], 'o', markersize=10, color=colors[i],
+                           label=f'Agent {i+1}')[0]
+                   for i in range(N_cmd)]
+    ax.legend()
+
     def init():
-        ax.clear()
         ax.set_xlim(pmin[0], pmax[0])
         ax.set_ylim(pmin[1], pmax[1])
         ax.set_zlim(0, pmax[2])
@@ -123,41 +129,21 @@ if view_animation:
         ax.set_ylabel('Y [m]')
         ax.set_zlabel('Z [m]')
         ax.grid(True)
-        return []
+        for art in pos_artists:
+            art.set_data_3d([], [], [])
+        return pos_artists
 
     def animate(k):
-        ax.clear()
-        ax.set_xlim(pmin[0], pmax[0])
-        ax.set_ylim(pmin[1], pmax[1])
-        ax.set_zlim(0, pmax[2])
-        ax.set_xlabel('X [m]')
-        ax.set_ylabel('Y [m]')
-        ax.set_zlabel('Z [m]')
-        ax.grid(True)
+        # Axis limits, labels and grid are constant and set once in init()
         ax.set_title(f'Time: {k*20*0.01:.2f}s')
 
-        for i in range(N):
-            if i < N_cmd:
-                # Plot current position
-                ax.plot([pk_downsampled[i, k, 0]], 
-                       [pk_downsampled[i, k, 1]], 
-                       [pk_downsampled[i, k, 2]], 
-                       'o', markersize=10, color=colors[i], label=f'Agent {i+1}')
-
-                # Plot initial position
-                ax.plot([po[0, i, 0]], [po[0, i, 1]], [po[0, i, 2]], 
-                       '^', markersize=10, color=colors[i])
-
-                # Plot target position
-                ax.plot([pf[0, i, 0]], [pf[0, i, 1]], [pf[0, i, 2]], 
-                       'x', markersize=10, color=colors[i], linewidth=3)
-            else:
-                # Only plot initial position for agents without commands
-                ax.plot([po[0, i, 0]], [po[0, i, 1]], [po[0, i, 2]], 
-                       '^', markersize=10, color=colors[i])
-
-        ax.legend()
-        return []
+        # Update current positions in place instead of clearing and replotting
+        for i, art in enumerate(pos_artists):
+            art.set_data_3d([pk_downsampled[i, k, 0]],
+                            [pk_downsampled[i, k, 1]],
+                            [pk_downsampled[i, k, 2]])
+
+        return pos_artists
 
     anim = animation.FuncAnimation(fig, animate, init_func=init,
                                  frames=pk_downsampled.shape[1], 